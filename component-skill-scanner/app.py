@@ -14,22 +14,226 @@ Scan Categories:
 
 import re
 import json
-from dataclasses import dataclass
-from typing import List, Dict, Any
+import array
+import bisect
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Final, Iterator, Optional, Pattern, Sequence, Tuple
 
 # Import the generated bindings
 import scanner_component.exports
 
-
-@dataclass
-class Finding:
-    """A security finding from the scan"""
-    category: str
-    severity: str  # critical, high, medium, low
-    pattern: str
-    line: int
-    context: str
-    description: str
+# RE2 matches in linear time, so hostile input cannot trigger catastrophic
+# backtracking. It is a native extension with no WASI build, so the WASM
+# component always falls back to the standard library engine.
+try:
+    import re2 as regex_engine  # type: ignore[import-untyped]
+except ImportError:
+    regex_engine = re
+
+# Aho-Corasick finds every prefilter literal in one linear pass; without it
+# each literal is located with str.find
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:
+    ahocorasick = None
+
+# orjson serializes far faster than json's pure-Python indented encoder; it
+# has no WASI build either, so the component keeps the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Characters re.IGNORECASE equates with an ASCII letter that str.lower() leaves
+# alone (or expands to two characters, shifting offsets)
+_CASEFOLD: Final = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _dumps(result: Dict[str, Any]) -> str:
+    """Serialize a scan result as indented JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects str holding lone surrogates; json escapes them
+            pass
+    return json.dumps(result, indent=2)
+
+
+# Escapes that stand for a character class, an assertion or a control
+# character. Every other alphanumeric escape (\x2e, \u002e, \N{...}, \0, \A,
+# ...) carries a payload or meaning the pattern helpers below do not decode,
+# so they give up on it.
+_SIMPLE_ESCAPES: Final = frozenset("sSdDwWbBnrtfva")
+
+# Class escapes whose meaning is Unicode-aware in re but ASCII-only in RE2
+_UNICODE_CLASS_ESCAPES: Final = frozenset("sSdDwWbB")
+
+# The characters re's \s matches other than \n, spelled out so RE2 sees the
+# same set as the table's [^\S\n]
+_HORIZONTAL_WHITESPACE: Final = "[\t\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+
+# An escape or a whole character class
+_ESCAPE_OR_CLASS: Final = re.compile(r"\\.|\[\^?\]?(?:\\.|[^\\\]])*\]", re.DOTALL)
+
+# A brace is only a quantifier in these forms; anything else is refused
+_BRACE_QUANTIFIER: Final = re.compile(r"\{(?:\d+(?:,\d*)?|,\d+)\}")
+
+
+def _mask_bits(mask: int) -> Iterator[int]:
+    """Yield the indexes of the set bits of a mask in ascending order"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _lowercase_pattern(pattern: str) -> Optional[str]:
+    """
+    Lowercase a pattern's literal characters, leaving escapes like \\S intact
+
+    Returns None if the pattern has an escape that encodes a character
+    (\\x41, \\u0041, \\N{...}, ...) or a character class with a range
+    ([A-z] covers more than [a-z]), neither of which can be lowercased in
+    place.
+    """
+    for m in _ESCAPE_OR_CLASS.finditer(pattern):
+        part = m.group()
+        if part[0] == "[":
+            items = re.findall(r"\\.|.", part[2:-1] if part[1] == "^" else part[1:-1], re.DOTALL)
+            if "-" in items[1:-1]:
+                return None
+    parts = []
+    for m in re.finditer(r"\\.|[^\\]+", pattern, re.DOTALL):
+        part = m.group()
+        if part[0] != "\\":
+            part = part.translate(_CASEFOLD).lower()
+        elif part[1].isalnum() and part[1] not in _SIMPLE_ESCAPES:
+            return None
+        parts.append(part)
+    return "".join(parts)
+
+
+def _spell_out_whitespace(pattern: str) -> str:
+    """Replace each [^\\S\\n] class in a pattern with its explicit characters"""
+    return _ESCAPE_OR_CLASS.sub(
+        lambda m: _HORIZONTAL_WHITESPACE if m.group() == r"[^\S\n]" else m.group(),
+        pattern,
+    )
+
+
+def _ascii_only_safe(pattern: str) -> bool:
+    """Whether a pattern matches the same text under RE2's ASCII-only classes"""
+    return not any(
+        m.group()[1] in _UNICODE_CLASS_ESCAPES for m in re.finditer(r"\\.", pattern, re.DOTALL)
+    )
+
+
+def _literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """Split a pattern into lowercase literals, or None if it needs a regex"""
+    literals = []
+    for alternative in pattern.split("|"):
+        literal = re.sub(r"\\(\W)", r"\1", alternative)
+        if not literal or re.escape(literal) != alternative:
+            return None
+        literals.append(literal.translate(_CASEFOLD).lower())
+    return literals
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Return the index just past the character class starting at i"""
+    i += 2 if pattern[i + 1] == "^" else 1
+    i += 1  # a leading ] is literal
+    while pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Return the index just past the group starting at i"""
+    depth = 0
+    while True:
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _skip_class(pattern, i)
+            continue
+        depth += {"(": 1, ")": -1}.get(ch, 0)
+        i += 1
+        if depth == 0:
+            return i
+
+
+def _required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Pick the longest literal run each top-level alternative requires (the
+    last one on ties, since trailing words tend to be the specific ones)
+
+    Any line the pattern matches contains one of the returned (lowercase)
+    literals. Returns None if some alternative has no literal run, or if the
+    pattern uses syntax outside the subset understood here (inline flags,
+    payload escapes, literal braces, possessive quantifiers), so the pattern is never filtered on a
+    misread literal.
+    """
+    if re.match(r"\(\?[a-zA-Z]", pattern):
+        return None
+
+    literals = []
+    run = longest = ""
+    i = 0
+    while i <= len(pattern):
+        if i == len(pattern) or pattern[i] == "|":
+            longest = max(run, longest, key=len)
+            if not longest:
+                return None
+            literals.append(longest.translate(_CASEFOLD).lower())
+            run = longest = ""
+            i += 1
+            continue
+
+        ch = pattern[i]
+        literal = None
+        if ch == "\\":
+            escaped = pattern[i + 1]
+            if not escaped.isalnum():
+                literal = escaped
+            elif escaped not in _SIMPLE_ESCAPES:
+                return None
+            i += 2
+        elif ch == "[":
+            i = _skip_class(pattern, i)
+        elif ch == "(":
+            i = _skip_group(pattern, i)
+        elif ch == "{":
+            return None
+        else:
+            if ch not in ".^$":
+                literal = ch
+            i += 1
+
+        # A quantified atom may repeat or vanish, so it ends the run
+        if i < len(pattern) and pattern[i] in "*+?{":
+            literal = None
+            if pattern[i] == "{":
+                quantifier = _BRACE_QUANTIFIER.match(pattern, i)
+                if quantifier is None:
+                    return None
+                i = quantifier.end() - 1
+            i += 1
+            if i < len(pattern) and pattern[i] == "?":
+                i += 1
+            elif i < len(pattern) and pattern[i] == "+":
+                return None
+
+        if literal is None:
+            longest = max(run, longest, key=len)
+            run = ""
+        else:
+            run += literal
+    return literals
 
 
 class SkillScanner:
@@ -45,13 +249,29 @@ class SkillScanner:
 
     def __init__(self):
         self.patterns = self._compile_patterns()
+        self.meta, self.literals, self.unfiltered, self.automaton = self._build_matchers(self.patterns)
+        # RE2 only accepts text that encodes as UTF-8, so input with lone
+        # surrogates is rescanned with every pattern compiled by re
+        self.re_meta = self.meta if regex_engine is re else [
+            (category, severity, description, re.compile(pattern.pattern))
+            for category, severity, description, pattern in self.meta
+        ]
+        self._scan_literals = (
+            self._scan_automaton if self.automaton is not None else self._generate_literal_scan()
+        )
 
     def _compile_patterns(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Compile all security patterns"""
+        """
+        Compile all security patterns
+
+        Patterns never match across a newline (whitespace and negated classes
+        exclude it), so they can run over the whole document and still report
+        per-line findings.
+        """
         return {
             "api_exfiltration": [
                 {
-                    "pattern": re.compile(r"os\.environ\s*\[|os\.environ\.get\s*\(|os\.getenv\s*\(", re.IGNORECASE),
+                    "pattern": re.compile(r"os\.environ[^\S\n]*\[|os\.environ\.get[^\S\n]*\(|os\.getenv[^\S\n]*\(", re.IGNORECASE),
                     "severity": "high",
                     "description": "Environment variable access - potential API key exfiltration",
                 },
@@ -117,65 +337,187 @@ class SkillScanner:
             ],
             "obfuscated_code": [
                 {
-                    "pattern": re.compile(r"base64\.b64decode\s*\([^)]+\)\s*\)?\s*\.decode|b64decode.*exec|b64decode.*eval", re.IGNORECASE),
+                    "pattern": re.compile(r"base64\.b64decode[^\S\n]*\([^)\n]+\)[^\S\n]*\)?[^\S\n]*\.decode|b64decode.*exec|b64decode.*eval", re.IGNORECASE),
                     "severity": "critical",
                     "description": "Base64 decode with execution - likely obfuscated malicious code",
                 },
                 {
-                    "pattern": re.compile(r"exec\s*\(\s*(base64|codecs|zlib|gzip)", re.IGNORECASE),
+                    "pattern": re.compile(r"exec[^\S\n]*\([^\S\n]*(base64|codecs|zlib|gzip)", re.IGNORECASE),
                     "severity": "critical",
                     "description": "Execution of encoded/compressed payload",
                 },
                 {
-                    "pattern": re.compile(r"eval\s*\(", re.IGNORECASE),
+                    "pattern": re.compile(r"eval[^\S\n]*\(", re.IGNORECASE),
                     "severity": "high",
                     "description": "Eval usage - can execute arbitrary code",
                 },
                 {
-                    "pattern": re.compile(r"exec\s*\(", re.IGNORECASE),
+                    "pattern": re.compile(r"exec[^\S\n]*\(", re.IGNORECASE),
                     "severity": "high",
                     "description": "Exec usage - can execute arbitrary code",
                 },
                 {
-                    "pattern": re.compile(r"compile\s*\([^)]+,[^)]*['\"]exec['\"]", re.IGNORECASE),
+                    "pattern": re.compile(r"compile[^\S\n]*\([^)\n]+,[^)\n]*['\"]exec['\"]", re.IGNORECASE),
                     "severity": "high",
                     "description": "Dynamic code compilation",
                 },
                 {
-                    "pattern": re.compile(r"__import__\s*\(", re.IGNORECASE),
+                    "pattern": re.compile(r"__import__[^\S\n]*\(", re.IGNORECASE),
                     "severity": "medium",
                     "description": "Dynamic import - may load unexpected modules",
                 },
                 {
-                    "pattern": re.compile(r"getattr\s*\([^,]+,\s*['\"][^'\"]+['\"]", re.IGNORECASE),
+                    "pattern": re.compile(r"getattr[^\S\n]*\([^,\n]+,[^\S\n]*['\"][^'\"\n]+['\"]", re.IGNORECASE),
                     "severity": "low",
                     "description": "Dynamic attribute access - review for safety",
                 },
             ],
             "dangerous_imports": [
                 {
-                    "pattern": re.compile(r"import\s+subprocess|from\s+subprocess", re.IGNORECASE),
+                    "pattern": re.compile(r"import[^\S\n]+subprocess|from[^\S\n]+subprocess", re.IGNORECASE),
                     "severity": "medium",
                     "description": "Subprocess import - can execute shell commands",
                 },
                 {
-                    "pattern": re.compile(r"import\s+socket|from\s+socket", re.IGNORECASE),
+                    "pattern": re.compile(r"import[^\S\n]+socket|from[^\S\n]+socket", re.IGNORECASE),
                     "severity": "medium",
                     "description": "Socket import - low-level network access",
                 },
                 {
-                    "pattern": re.compile(r"import\s+ctypes|from\s+ctypes", re.IGNORECASE),
+                    "pattern": re.compile(r"import[^\S\n]+ctypes|from[^\S\n]+ctypes", re.IGNORECASE),
                     "severity": "high",
                     "description": "Ctypes import - can call arbitrary C functions",
                 },
                 {
-                    "pattern": re.compile(r"import\s+pickle|from\s+pickle", re.IGNORECASE),
+                    "pattern": re.compile(r"import[^\S\n]+pickle|from[^\S\n]+pickle", re.IGNORECASE),
                     "severity": "high",
                     "description": "Pickle import - deserialization can execute arbitrary code",
                 },
             ],
         }
 
+    def _build_matchers(
+        self, patterns: Dict[str, List[Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[str, str, str, Pattern]], Dict[str, Tuple[int, int]], List[int], Any]:
+        """
+        Build the two-stage matcher for the pattern table
+
+        Patterns are numbered in table order and described by a flat
+        (category, severity, description, pattern) metadata list. The first
+        stage is a literal table mapping each lowercase literal to a pair of
+        pattern-id bitmasks (bit n set = pattern n). Exact bits are patterns
+        the literal is a whole alternative of, so an occurrence is a finding
+        by itself; candidate bits are patterns the literal is a signature of,
+        whose regex must still confirm the line. Patterns without a signature
+        are listed separately and run over the whole document. When
+        pyahocorasick is installed the literal table is also compiled into an
+        automaton with (length, exact mask, candidate mask) payloads.
+        """
+        meta: List[Tuple[str, str, str, Pattern]] = []
+        literal_masks: Dict[str, Tuple[int, int]] = {}
+        unfiltered = []
+        for category, infos in patterns.items():
+            for info in infos:
+                pattern_id = len(meta)
+                # The document is lowercased once for all patterns, which
+                # only emulates a plain re.IGNORECASE compile
+                if info["pattern"].flags != re.IGNORECASE | re.UNICODE:
+                    raise ValueError(
+                        f"pattern {info['pattern'].pattern!r} must be compiled with re.IGNORECASE and no other flags"
+                    )
+                # Patterns run case-sensitively against the lowercased
+                # document instead of case-folding every comparison; those
+                # that cannot be lowercased keep case-insensitive matching
+                lowered = _lowercase_pattern(info["pattern"].pattern)
+                compiled = None
+                if lowered is None:
+                    lowered = "(?i)" + info["pattern"].pattern
+                elif regex_engine is not re:
+                    # RE2 treats \s, \w, \d and \b as ASCII-only and its (?i)
+                    # does not fold the characters _CASEFOLD handles, so it
+                    # only gets patterns where neither difference can show,
+                    # and only those it can parse
+                    spelled = _spell_out_whitespace(lowered)
+                    if _ascii_only_safe(spelled):
+                        try:
+                            compiled = regex_engine.compile(spelled)
+                        except regex_engine.error:
+                            pass
+                if compiled is None:
+                    compiled = re.compile(lowered)
+                meta.append((category, info["severity"], info["description"], compiled))
+
+                exact = True
+                literals = _literal_alternatives(info["pattern"].pattern)
+                if literals is None:
+                    exact = False
+                    literals = _required_literals(info["pattern"].pattern)
+                if literals is None:
+                    unfiltered.append(pattern_id)
+                    continue
+                bit = 1 << pattern_id
+                for literal in literals:
+                    exact_mask, candidate_mask = literal_masks.get(literal, (0, 0))
+                    if exact:
+                        exact_mask |= bit
+                    else:
+                        candidate_mask |= bit
+                    literal_masks[literal] = (exact_mask, candidate_mask)
+
+        automaton = None
+        if ahocorasick is not None and literal_masks:
+            automaton = ahocorasick.Automaton()
+            for literal, masks in literal_masks.items():
+                automaton.add_word(literal, (len(literal), *masks))
+            automaton.make_automaton()
+        return meta, literal_masks, unfiltered, automaton
+
+    def _scan_automaton(
+        self, text: str, nl_offsets: Sequence[int], hits: Dict[int, int], candidates: Dict[int, int]
+    ) -> None:
+        """OR the masks of every literal in lowercase text into per-line hit/candidate masks"""
+        for end, (length, exact_mask, candidate_mask) in self.automaton.iter(text):
+            line_num = bisect.bisect_left(nl_offsets, end - length + 1) + 1
+            if exact_mask:
+                hits[line_num] = hits.get(line_num, 0) | exact_mask
+            if candidate_mask:
+                candidates[line_num] = candidates.get(line_num, 0) | candidate_mask
+
+    def _generate_literal_scan(self) -> Callable[[str, Sequence[int], Dict[int, int], Dict[int, int]], None]:
+        """
+        Generate the str.find fallback of _scan_automaton as straight-line code
+
+        Each literal gets its own unrolled find loop with its masks inlined as
+        constants, so the hot loop does no per-literal table lookups, tuple
+        unpacking or generator round-trips. After a hit the search resumes on
+        the next line, since one occurrence per line is enough.
+        """
+        src = [
+            "def scan_literals(text, nl_offsets, hits, candidates):",
+            "    find = text.find",
+        ]
+        for literal, (exact_mask, candidate_mask) in self.literals.items():
+            src += [
+                f"    pos = find({literal!r})",
+                "    while pos != -1:",
+                "        line_num = bisect_left(nl_offsets, pos) + 1",
+            ]
+            if exact_mask:
+                src.append(f"        hits[line_num] = hits.get(line_num, 0) | {exact_mask}")
+            if candidate_mask:
+                src.append(f"        candidates[line_num] = candidates.get(line_num, 0) | {candidate_mask}")
+            src += [
+                "        pos = find('\\n', pos)",
+                "        if pos == -1:",
+                "            break",
+                f"        pos = find({literal!r}, pos + 1)",
+            ]
+        src.append("    return None")
+
+        namespace: Dict[str, Any] = {}
+        exec("\n".join(src), {"bisect_left": bisect.bisect_left}, namespace)
+        return namespace["scan_literals"]
+
     def scan(self, code: str) -> Dict[str, Any]:
         """
         Scan code for security issues
@@ -185,78 +527,109 @@ class SkillScanner:
         - safety_score: float 0-1 (1 = safe, 0 = dangerous)
         - summary: human-readable summary
         """
-        findings: List[Finding] = []
-        lines = code.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            for category, patterns in self.patterns.items():
-                for pattern_info in patterns:
-                    if pattern_info["pattern"].search(line):
-                        # Get context (line content, trimmed)
-                        context = line.strip()[:100]
-                        if len(line.strip()) > 100:
-                            context += "..."
-
-                        findings.append(Finding(
-                            category=category,
-                            severity=pattern_info["severity"],
-                            pattern=pattern_info["pattern"].pattern[:50],
-                            line=line_num,
-                            context=context,
-                            description=pattern_info["description"],
-                        ))
+        try:
+            return self._scan(code, self.meta)
+        except UnicodeEncodeError:
+            return self._scan(code, self.re_meta)
+
+    def _scan(self, code: str, meta: List[Tuple[str, str, str, Pattern]]) -> Dict[str, Any]:
+        """Scan code, running regexes from the given pattern metadata"""
+        findings: List[Dict[str, Any]] = []
+        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        penalty = 0.0
+        # Insertion-ordered set, so the summary lists categories as first seen
+        categories_seen: Dict[str, None] = {}
+        # Newline offsets for bisecting match offsets into line numbers, packed
+        # into a machine-int array rather than a list of int objects
+        nl_offsets = array.array("q", map(re.Match.start, re.finditer("\n", code)))
+
+        # Matching runs on a lowercased copy (emulating re.IGNORECASE) of the
+        # same length, so offsets carry over to the original for context
+        text = code.translate(_CASEFOLD).lower()
+
+        # Stage one: a single literal pass ORs pattern bitmasks into per-line
+        # hit and candidate masks, so each (line, pattern) pair is recorded
+        # once however many literals or occurrences point at it
+        hits: Dict[int, int] = {}
+        candidates: Dict[int, int] = {}
+        self._scan_literals(text, nl_offsets, hits, candidates)
+
+        for pattern_id in self.unfiltered:
+            for m in meta[pattern_id][3].finditer(text):
+                line_num = bisect.bisect_left(nl_offsets, m.start()) + 1
+                hits[line_num] = hits.get(line_num, 0) | 1 << pattern_id
+
+        for line_num in sorted(hits.keys() | candidates.keys()):
+            start = nl_offsets[line_num - 2] + 1 if line_num > 1 else 0
+            end = nl_offsets[line_num - 1] if line_num <= len(nl_offsets) else len(code)
+            line_hits = hits.get(line_num, 0)
+
+            # Stage two: regexes only run on the lines their signature hit,
+            # skipping patterns the line already matched. Line strings are
+            # only sliced out of the document once they are needed.
+            pending = candidates.get(line_num, 0) & ~line_hits
+            if pending:
+                line_text = text[start:end]
+                for pattern_id in _mask_bits(pending):
+                    if meta[pattern_id][3].search(line_text):
+                        line_hits |= 1 << pattern_id
+
+            if not line_hits:
+                continue
+
+            # Get context (line content, trimmed), shared by the line's findings
+            stripped = code[start:end].strip()
+            context = stripped if len(stripped) <= 100 else stripped[:100] + "..."
+
+            for pattern_id in _mask_bits(line_hits):
+                category, severity, description, _ = meta[pattern_id]
+                findings.append({
+                    "category": category,
+                    "severity": severity,
+                    "line": line_num,
+                    "context": context,
+                    "description": description,
+                })
+                if severity in severity_counts:
+                    severity_counts[severity] += 1
+                penalty += self.SEVERITY_WEIGHTS.get(severity, 0.1)
+                categories_seen[category] = None
 
         # Calculate safety score
-        safety_score = self._calculate_safety_score(findings)
+        safety_score = self._calculate_safety_score(penalty)
 
         # Generate summary
-        summary = self._generate_summary(findings, safety_score)
+        summary = self._generate_summary(findings, safety_score, severity_counts, categories_seen)
 
         return {
-            "findings": [
-                {
-                    "category": f.category,
-                    "severity": f.severity,
-                    "line": f.line,
-                    "context": f.context,
-                    "description": f.description,
-                }
-                for f in findings
-            ],
+            "findings": findings,
             "safety_score": round(safety_score, 2),
             "summary": summary,
             "total_findings": len(findings),
-            "findings_by_severity": {
-                "critical": len([f for f in findings if f.severity == "critical"]),
-                "high": len([f for f in findings if f.severity == "high"]),
-                "medium": len([f for f in findings if f.severity == "medium"]),
-                "low": len([f for f in findings if f.severity == "low"]),
-            },
+            "findings_by_severity": severity_counts,
         }
 
-    def _calculate_safety_score(self, findings: List[Finding]) -> float:
-        """Calculate safety score from 0 (dangerous) to 1 (safe)"""
-        if not findings:
-            return 1.0
-
-        # Calculate penalty based on severity weights
-        penalty = sum(
-            self.SEVERITY_WEIGHTS.get(f.severity, 0.1)
-            for f in findings
-        )
+    def _calculate_safety_score(self, penalty: float) -> float:
+        """
+        Calculate safety score from 0 (dangerous) to 1 (safe)
 
+        The penalty is the sum of the findings' severity weights, accumulated
+        during the scan.
+        """
         # Clamp to 0-1 range
         return max(0.0, min(1.0, 1.0 - penalty))
 
-    def _generate_summary(self, findings: List[Finding], safety_score: float) -> str:
+    def _generate_summary(
+        self,
+        findings: List[Dict[str, Any]],
+        safety_score: float,
+        severity_counts: Dict[str, int],
+        categories: Dict[str, None],
+    ) -> str:
         """Generate human-readable summary"""
         if not findings:
             return "No security issues detected. Code appears safe."
 
-        severity_counts = {}
-        for f in findings:
-            severity_counts[f.severity] = severity_counts.get(f.severity, 0) + 1
-
         parts = []
         if severity_counts.get("critical", 0) > 0:
             parts.append(f"{severity_counts['critical']} CRITICAL")
@@ -278,8 +651,6 @@ class SkillScanner:
         else:
             risk_level = "MINOR CONCERNS"
 
-        # Get unique categories
-        categories = list(set(f.category for f in findings))
         category_str = ", ".join(c.replace("_", " ") for c in categories)
 
         return f"{risk_level}: Found {len(findings)} issues ({severity_summary}). Categories: {category_str}."
@@ -288,11 +659,33 @@ class SkillScanner:
 # Global scanner instance
 _scanner = SkillScanner()
 
+# JSON results of recent scans, keyed by a digest of the scanned code. Scans
+# are pure, so resubmitted code (common in CI loops) skips the scan entirely.
+# Results are bounded by count and by total length, and a result too large to
+# share the budget with others is not cached at all.
+_SCAN_CACHE_SIZE: Final = 512
+_SCAN_CACHE_MAX_CHARS: Final = 8 * 1024 * 1024
+_SCAN_CACHE_MAX_ENTRY_CHARS: Final = _SCAN_CACHE_MAX_CHARS // 8
+_scan_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_scan_cache_chars = 0
+
 
 class Scanner(scanner_component.exports.Scanner):
     """Implementation of the scanner interface for WASM component"""
 
     def scan_code(self, code: str) -> str:
         """Scan code and return JSON results"""
-        result = _scanner.scan(code)
-        return json.dumps(result, indent=2)
+        global _scan_cache_chars
+        key = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = _scan_cache.get(key)
+        if cached is not None:
+            _scan_cache.move_to_end(key)
+            return cached
+
+        result = _dumps(_scanner.scan(code))
+        if len(result) <= _SCAN_CACHE_MAX_ENTRY_CHARS:
+            _scan_cache[key] = result
+            _scan_cache_chars += len(result)
+            while len(_scan_cache) > _SCAN_CACHE_SIZE or _scan_cache_chars > _SCAN_CACHE_MAX_CHARS:
+                _scan_cache_chars -= len(_scan_cache.popitem(last=False)[1])
+        return result
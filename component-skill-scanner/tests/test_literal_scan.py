@@ -0,0 +1,78 @@
+"""Tests for the stage-one literal pass and its two implementations"""
+
+import array
+import glob
+import os
+import re
+import unittest
+from unittest import mock
+
+import app
+from app import SkillScanner
+
+EXAMPLES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "..", "..", "examples", "malicious-skills", "*.py")))
+
+SAMPLES = [
+    "",
+    "eval(1)",
+    "\n\nOPENAI_API_KEY\n",
+    "x = 1\nimport pickle; eval(exec(1)) ; EVAL(2)\nid_rsa id_rsa\n~/.ssh",
+    "webhook.site\npastebin.com ngrok.io\nİD_RSA ſecrets.json",
+]
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _run_stage_one(scanner, code):
+    """Return the (hits, candidates) masks a scanner's literal pass produces"""
+    nl_offsets = array.array("q", map(re.Match.start, re.finditer("\n", code)))
+    hits, candidates = {}, {}
+    scanner._scan_literals(code.translate(app._CASEFOLD).lower(), nl_offsets, hits, candidates)
+    return hits, candidates
+
+
+def _reference_stage_one(scanner, code):
+    """Compute the same masks by testing every literal against every line"""
+    hits, candidates = {}, {}
+    for line_num, line in enumerate(code.translate(app._CASEFOLD).lower().split("\n"), 1):
+        for literal, (exact_mask, candidate_mask) in scanner.literals.items():
+            if literal in line:
+                if exact_mask:
+                    hits[line_num] = hits.get(line_num, 0) | exact_mask
+                if candidate_mask:
+                    candidates[line_num] = candidates.get(line_num, 0) | candidate_mask
+    return hits, candidates
+
+
+class LiteralScanTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(app, "ahocorasick", None):
+            self.generated = SkillScanner()
+        self.codes = SAMPLES + [_read(path) for path in EXAMPLES]
+
+    def test_examples_are_found(self):
+        self.assertTrue(EXAMPLES)
+
+    def test_generated_scan_matches_reference(self):
+        self.assertIsNone(self.generated.automaton)
+        self.assertTrue(self.generated.literals)
+        for code in self.codes:
+            with self.subTest(code=code[:40]):
+                self.assertEqual(_run_stage_one(self.generated, code), _reference_stage_one(self.generated, code))
+
+    @unittest.skipIf(app.ahocorasick is None, "pyahocorasick is not installed")
+    def test_automaton_scan_matches_generated_scan(self):
+        scanner = SkillScanner()
+        self.assertIsNotNone(scanner.automaton)
+        for code in self.codes:
+            with self.subTest(code=code[:40]):
+                self.assertEqual(_run_stage_one(scanner, code), _run_stage_one(self.generated, code))
+                self.assertEqual(scanner.scan(code), self.generated.scan(code))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+"""Tests for the pattern-table helpers that drive the literal prefilter"""
+
+import re
+import unittest
+
+import app
+from app import (
+    SkillScanner,
+    _ascii_only_safe,
+    _literal_alternatives,
+    _lowercase_pattern,
+    _required_literals,
+    _spell_out_whitespace,
+)
+
+
+class ExtraPatternScanner(SkillScanner):
+    """Scanner whose table holds only the given (pattern, severity) entries"""
+
+    def __init__(self, *patterns, flags=re.IGNORECASE):
+        self._extra = patterns
+        self._flags = flags
+        super().__init__()
+
+    def _compile_patterns(self):
+        return {
+            "test": [
+                {"pattern": re.compile(p, self._flags), "severity": severity, "description": p}
+                for p, severity in self._extra
+            ]
+        }
+
+
+class LiteralAlternativesTest(unittest.TestCase):
+
+    def test_splits_and_lowercases_literals(self):
+        self.assertEqual(
+            _literal_alternatives(r"OPENAI_API_KEY|secrets\.json"),
+            ["openai_api_key", "secrets.json"],
+        )
+
+    def test_rejects_regex_syntax(self):
+        for pattern in [r"~/.ssh|id_rsa", r"eval\s*\(", r"(a|b)", r"a|", r"\x2eenv", r"a{2}"]:
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(_literal_alternatives(pattern))
+
+
+class RequiredLiteralsTest(unittest.TestCase):
+
+    def test_longest_run_per_alternative(self):
+        self.assertEqual(
+            _required_literals(r"os\.environ[^\S\n]*\[|os\.getenv[^\S\n]*\("),
+            ["os.environ", "os.getenv"],
+        )
+
+    def test_prefers_last_run_on_ties(self):
+        self.assertEqual(_required_literals(r"import[^\S\n]+socket"), ["socket"])
+
+    def test_quantified_atoms_end_the_run(self):
+        self.assertEqual(_required_literals(r"ab?c"), ["c"])
+        self.assertEqual(_required_literals(r"ab{2,3}cd"), ["cd"])
+        self.assertEqual(_required_literals(r"(base64|zlib)+exec"), ["exec"])
+
+    def test_class_escapes_end_the_run(self):
+        self.assertEqual(_required_literals(r"\bfoo\d+"), ["foo"])
+        self.assertEqual(_required_literals(r"foo\tbar"), ["bar"])
+
+    def test_alternative_without_literal(self):
+        self.assertIsNone(_required_literals(r"foo|.*"))
+        self.assertIsNone(_required_literals(r"foo|"))
+
+    def test_gives_up_on_unsupported_syntax(self):
+        for pattern in [
+            r"open\(.*\x2eenv",
+            r"\x41PI_TOKEN",
+            r"\N{LATIN CAPITAL LETTER A}PI_TOKEN",
+            r"\0abc",
+            r"\Aabc",
+            r"a{b",
+            r"{abc",
+            r"(?i)abc",
+            r"xa*+b",
+            r"import[^\S\n]++pickle",
+            r"ab{2}+c",
+        ]:
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(_required_literals(pattern))
+
+    def test_table_patterns_all_get_signatures(self):
+        for infos in SkillScanner().patterns.values():
+            for info in infos:
+                with self.subTest(pattern=info["pattern"].pattern):
+                    self.assertIsNotNone(_required_literals(info["pattern"].pattern))
+
+
+class LowercasePatternTest(unittest.TestCase):
+
+    def test_lowercases_literals_but_not_escapes(self):
+        self.assertEqual(
+            _lowercase_pattern(r"OPENAI_API_KEY|Import[^\S\n]+\W\.ENV"),
+            r"openai_api_key|import[^\S\n]+\W\.env",
+        )
+
+    def test_folds_characters_ignorecase_equates_with_ascii(self):
+        self.assertEqual(_lowercase_pattern("\u0130D_RSA|\u017fSH"), "id_rsa|ssh")
+
+    def test_rejects_escapes_encoding_a_character(self):
+        for pattern in [r"\x41PI", r"\u0041PI", r"\N{LATIN CAPITAL LETTER A}PI", r"[\x41-\x5a]", r"\101"]:
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(_lowercase_pattern(pattern))
+
+
+    def test_rejects_classes_with_ranges(self):
+        for pattern in [r"key[A-z]+", r"key[Z-a]", r"[^A-Z]", r"[]-a]"]:
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(_lowercase_pattern(pattern))
+
+    def test_lowercases_classes_without_ranges(self):
+        self.assertEqual(_lowercase_pattern(r"[^-A]B[A-][\-Z]"), r"[^-a]b[a-][\-z]")
+
+
+class UnfilteredPatternTest(unittest.TestCase):
+
+    def test_brace_literal_does_not_break_loading(self):
+        scanner = ExtraPatternScanner((r"a{b", "low"))
+        self.assertEqual(scanner.scan("xa{by")["total_findings"], 1)
+
+    def test_unknown_severity_is_weighted_but_not_counted(self):
+        result = ExtraPatternScanner((r"eval\(", "info")).scan("eval(1)")
+        self.assertEqual(result["total_findings"], 1)
+        self.assertEqual(result["safety_score"], 0.9)
+        self.assertEqual(result["findings_by_severity"], {"critical": 0, "high": 0, "medium": 0, "low": 0})
+
+    def test_possessive_quantifier_still_matches(self):
+        scanner = ExtraPatternScanner((r"xa*+b", "low"), (r"import[^\S\n]++pickle", "high"))
+        result = scanner.scan("xaab\nimport  pickle")
+        self.assertEqual([f["line"] for f in result["findings"]], [1, 2])
+
+    def test_class_ranges_keep_their_case_insensitive_meaning(self):
+        scanner = ExtraPatternScanner((r"key[A-z]+", "low"), (r"KEY[Z-a]", "low"))
+        result = scanner.scan("key_x\nkey^")
+        self.assertEqual([f["line"] for f in result["findings"]], [1, 1, 2, 2])
+
+    def test_flags_other_than_ignorecase_are_refused(self):
+        for flags in [0, re.IGNORECASE | re.VERBOSE, re.IGNORECASE | re.MULTILINE]:
+            with self.subTest(flags=flags):
+                with self.assertRaises(ValueError):
+                    ExtraPatternScanner((r"API", "low"), flags=flags)
+        with self.assertRaises(ValueError):
+            ExtraPatternScanner((r"(?x) API", "low"))
+
+    def test_payload_escapes_still_match(self):
+        scanner = ExtraPatternScanner((r"open\(.*\x2eenv", "high"), (r"\x41PI_TOKEN", "high"))
+        result = scanner.scan('open(".env")\nAPI_TOKEN=1')
+        self.assertEqual([f["line"] for f in result["findings"]], [1, 2])
+
+
+class UnicodeInputTest(unittest.TestCase):
+
+    def test_unicode_whitespace_separates_call(self):
+        scanner = SkillScanner()
+        for sep in ["\x0b", "\x1c", "\x85", "\xa0", "\u2028"]:
+            with self.subTest(sep=sep):
+                self.assertEqual(scanner.scan(f"eval{sep}(1)")["total_findings"], 1)
+
+    def test_lone_surrogate_does_not_raise(self):
+        result = SkillScanner().scan('x = "\ud800"\neval(1)')
+        self.assertEqual([f["line"] for f in result["findings"]], [2])
+
+    def test_unicode_class_escapes_are_not_ascii_only_safe(self):
+        self.assertTrue(_ascii_only_safe(r"eval\(|\.env"))
+        for pattern in [r"eval[^\S\n]*\(", r"\bexec\b", r"\w+=", r"\d"]:
+            with self.subTest(pattern=pattern):
+                self.assertFalse(_ascii_only_safe(pattern))
+
+    def test_spelled_out_whitespace_matches_what_re_does(self):
+        spelled = re.compile(_spell_out_whitespace(r"[^\S\n]"))
+        self.assertTrue(_ascii_only_safe(spelled.pattern))
+        chars = [chr(code) for code in range(0x110000)]
+        self.assertEqual(
+            [c for c in chars if spelled.match(c)],
+            [c for c in chars if re.match(r"[^\S\n]", c)],
+        )
+
+    def test_spelled_out_whitespace_leaves_other_classes(self):
+        for pattern in [r"\[^\S\n]", r"[^\S]", r"[^\S\n ]"]:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(_spell_out_whitespace(pattern), pattern)
+
+
+@unittest.skipIf(app.regex_engine is re, "google-re2 is not installed")
+class Re2EngineTest(unittest.TestCase):
+
+    def test_table_patterns_run_on_re2(self):
+        for category, _, description, pattern in SkillScanner().meta:
+            with self.subTest(category=category, description=description):
+                self.assertNotIsInstance(pattern, re.Pattern)
+
+    def test_pattern_re2_cannot_parse_falls_back_to_re(self):
+        scanner = ExtraPatternScanner((r"xa*+b", "low"))
+        self.assertIsInstance(scanner.meta[0][3], re.Pattern)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for the JSON-returning scanner export"""
+
+import glob
+import json
+import os
+import unittest
+from unittest import mock
+
+import app
+from app import Scanner, _dumps
+
+
+class DumpsTest(unittest.TestCase):
+
+    def test_lone_surrogate_is_escaped(self):
+        result = {"context": 'eval("\ud800")'}
+        self.assertEqual(json.loads(_dumps(result)), result)
+
+
+class ScanCodeTest(unittest.TestCase):
+
+    def test_finding_context_with_lone_surrogate(self):
+        result = json.loads(Scanner().scan_code('eval("\ud800")'))
+        self.assertEqual(result["findings"][0]["context"], 'eval("\ud800")')
+
+
+def _sort_summary_categories(result):
+    """Sort the summary's category list, whose order the original scanner took from a set"""
+    head, sep, categories = result["summary"].partition("Categories: ")
+    if sep:
+        result["summary"] = head + sep + ", ".join(sorted(categories.rstrip(".").split(", "))) + "."
+    return result
+
+
+class GoldenExamplesTest(unittest.TestCase):
+    """Findings on the example skills, as recorded from the original scanner"""
+
+    def test_example_skills_match_golden_results(self):
+        here = os.path.dirname(__file__)
+        with open(os.path.join(here, "golden", "malicious_skills.json"), encoding="utf-8") as f:
+            golden = json.load(f)
+        paths = glob.glob(os.path.join(here, "..", "..", "examples", "malicious-skills", "*.py"))
+        self.assertEqual(sorted(map(os.path.basename, paths)), sorted(golden))
+        for path in paths:
+            with self.subTest(example=os.path.basename(path)):
+                with open(path, encoding="utf-8") as f:
+                    result = json.loads(Scanner().scan_code(f.read()))
+                self.assertEqual(
+                    _sort_summary_categories(result), _sort_summary_categories(golden[os.path.basename(path)])
+                )
+
+
+class ScanCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        app._scan_cache.clear()
+        app._scan_cache_chars = 0
+
+    tearDown = setUp
+
+    def test_total_length_is_bounded(self):
+        entry = len(Scanner().scan_code("eval(0)"))
+        with mock.patch.object(app, "_SCAN_CACHE_MAX_CHARS", entry * 3):
+            for i in range(10):
+                Scanner().scan_code(f"eval({i})")
+        self.assertEqual(len(app._scan_cache), 3)
+        self.assertEqual(app._scan_cache_chars, sum(map(len, app._scan_cache.values())))
+
+    def test_oversized_result_is_not_cached(self):
+        with mock.patch.object(app, "_SCAN_CACHE_MAX_ENTRY_CHARS", 10):
+            Scanner().scan_code("eval(1)")
+        self.assertEqual(len(app._scan_cache), 0)
+        self.assertEqual(app._scan_cache_chars, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()